@@ -6,11 +6,32 @@ import json
 from typing import List
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+
+_SESSION: "requests.Session" = None  # type: ignore
+
+
+def get_session() -> requests.Session:
+    """Return a shared Session with pooling + retries (keeps TLS to the API warm)."""
+    global _SESSION
+    if _SESSION is None:
+        s = requests.Session()
+        s.headers.update({"User-Agent": "rsi-freqai-bot/1.0"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        _SESSION = s
+    return _SESSION
 
 
 def fetch(limit: int = 2000) -> List[dict]:
     url = f"https://api.alternative.me/fng/?limit={limit}"
-    r = requests.get(url, timeout=10)
+    r = get_session().get(url, timeout=10)
     r.raise_for_status()
     data = r.json()["data"]
     return data
@@ -18,17 +39,18 @@ def fetch(limit: int = 2000) -> List[dict]:
 
 def write_csv(rows: List[dict], outpath: pathlib.Path) -> None:
     outpath.parent.mkdir(parents=True, exist_ok=True)
-    with outpath.open("w", encoding="utf-8") as f:
-        f.write("date,value\n")
-        # API returns newest-first; write oldest-first
-        for row in reversed(rows):
-            # row: { value: "68", timestamp: "1735516800", time_until_update: "...", value_classification: "Greed" }
-            ts = int(row.get("timestamp", 0))
-            if ts <= 0:
-                continue
-            d = time.strftime("%Y-%m-%d", time.gmtime(ts))
-            val = row.get("value", "50")
-            f.write(f"{d},{val}\n")
+    # API returns newest-first; write oldest-first. Build all lines in memory
+    # and flush with a single write instead of one f.write per row.
+    lines = ["date,value\n"]
+    for row in reversed(rows):
+        # row: { value: "68", timestamp: "1735516800", time_until_update: "...", value_classification: "Greed" }
+        ts = int(row.get("timestamp", 0))
+        if ts <= 0:
+            continue
+        d = time.strftime("%Y-%m-%d", time.gmtime(ts))
+        val = row.get("value", "50")
+        lines.append(f"{d},{val}\n")
+    outpath.write_text("".join(lines), encoding="utf-8")
 
 
 def main() -> int:
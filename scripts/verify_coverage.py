@@ -3,10 +3,42 @@ import argparse
 import datetime as dt
 import gzip
 import json
+import mmap
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
+try:
+    import ijson  # Optional: streaming JSON, keeps O(1) memory on huge OHLCV files
+except Exception:
+    ijson = None
+
+try:
+    import numpy as np
+    import pandas as pd
+except Exception:
+    np = None
+    pd = None
+
+try:
+    import rapidgzip  # Optional: multi-threaded gzip inflate for large .json.gz
+except Exception:
+    rapidgzip = None
+
+try:
+    import orjson  # Optional: 2-4x faster decode on numeric list-of-lists JSON
+except Exception:
+    orjson = None
+
+try:
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+except Exception:
+    pa_feather = None
+    pa_parquet = None
+
 
 ROOT = Path(__file__).resolve().parents[1]
 CONFIG = ROOT / "user_data" / "config.json"
@@ -33,13 +65,18 @@ def infer_data_path(exchange: str, timeframe: str, pair: str, mode: str) -> Opti
     nested_dir = data_dir / subdir if subdir else data_dir
     flat_dir = data_dir  # Legacy flat is directly in data/{exch}
 
+    # Columnar formats first: reading just the date column is far cheaper than
+    # parsing the whole JSON text ("dataformat_ohlcv" in config.json decides
+    # which actually exists on disk).
     candidates = [
+        nested_dir / f"{file_base}.feather",
+        nested_dir / f"{file_base}.parquet",
         nested_dir / f"{file_base}.json",
         nested_dir / f"{file_base}.json.gz",
+        flat_dir / f"{file_base}.feather",
+        flat_dir / f"{file_base}.parquet",
         flat_dir / f"{file_base}.json",
         flat_dir / f"{file_base}.json.gz",
-        # Add .feather or .parquet if your config uses them (check "dataformat_ohlcv" in config.json)
-        # nested_dir / f"{file_base}.feather",
     ]
     for c in candidates:
         if c.exists():
@@ -47,23 +84,145 @@ def infer_data_path(exchange: str, timeframe: str, pair: str, mode: str) -> Opti
     return None
 
 
+def _open_gz(path: Path):
+    """Open a .gz file for binary reading, preferring rapidgzip's parallel inflate."""
+    if rapidgzip is not None:
+        return rapidgzip.open(str(path), parallelization=os.cpu_count() or 1)
+    return gzip.open(path, "rb")
+
+
+# Row-start timestamp in list-of-lists OHLCV JSON, e.g. "[1698796800000,"
+_ROW_TS_RE = re.compile(rb"\[\s*(\d{10,16})")
+
+
+def _mmap_ts_range(path: Path) -> Optional[Tuple[dt.datetime, dt.datetime]]:
+    """O(1) bounds scan for plain list-of-lists .json files.
+
+    mmaps the file and regex-scans only the first and last few hundred bytes
+    for row timestamps, so nothing in between is read or parsed. Returns None
+    on any other layout so the caller can fall back.
+    """
+    try:
+        with path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                head = bytes(mm[:256])
+                tail = bytes(mm[-512:])
+        first = _ROW_TS_RE.search(head)
+        lasts = _ROW_TS_RE.findall(tail)
+        if not first or not lasts:
+            return None
+        tmin = int(first.group(1))
+        tmax = int(lasts[-1])
+        if tmax < tmin:
+            return None
+        return (
+            dt.datetime.fromtimestamp(tmin / 1000, dt.timezone.utc),
+            dt.datetime.fromtimestamp(tmax / 1000, dt.timezone.utc),
+        )
+    except (OSError, ValueError):
+        return None
+
+
+def _columnar_ts_range(path: Path) -> Optional[Tuple[dt.datetime, dt.datetime]]:
+    """Read first/last timestamp from feather/parquet by loading only 'date'."""
+    def _norm(v) -> dt.datetime:
+        if isinstance(v, (int, float)):
+            return dt.datetime.fromtimestamp(float(v) / 1000, dt.timezone.utc)
+        if v.tzinfo is None:
+            return v.replace(tzinfo=dt.timezone.utc)
+        return v.astimezone(dt.timezone.utc)
+
+    try:
+        if path.suffix == ".feather":
+            if pa_feather is None:
+                return None
+            col = pa_feather.read_table(str(path), columns=["date"])["date"]
+            if len(col) == 0:
+                return None
+            first, last = col[0].as_py(), col[-1].as_py()
+        else:
+            if pa_parquet is None:
+                return None
+            pf = pa_parquet.ParquetFile(str(path))
+            if pf.metadata.num_rows == 0:
+                return None
+            head = pf.read_row_group(0, columns=["date"])["date"]
+            tail = pf.read_row_group(pf.num_row_groups - 1, columns=["date"])["date"]
+            first, last = head[0].as_py(), tail[-1].as_py()
+        lo, hi = _norm(first), _norm(last)
+        return (lo, hi) if lo <= hi else (hi, lo)
+    except Exception:
+        return None
+
+
+def _stream_ts_range(f) -> Optional[Tuple[dt.datetime, dt.datetime]]:
+    """Stream a list-of-lists OHLCV file keeping only the first/last timestamp.
+
+    Avoids json.load()'s O(file) peak RAM; returns None on any other layout so
+    the caller can fall back to the full parse.
+    """
+    first = None
+    last = None
+    for row in ijson.items(f, "item"):
+        if not isinstance(row, (list, tuple)) or len(row) < 6:
+            return None
+        ts = int(row[0])
+        if first is None:
+            first = ts
+        last = ts
+    if first is None or last is None:
+        return None
+    if last < first:
+        first, last = last, first
+    return (
+        dt.datetime.fromtimestamp(first / 1000, dt.timezone.utc),
+        dt.datetime.fromtimestamp(last / 1000, dt.timezone.utc),
+    )
+
+
 def read_ts_range(path: Path) -> Optional[Tuple[dt.datetime, dt.datetime]]:
     def _parse_rows(rows) -> Optional[Tuple[dt.datetime, dt.datetime]]:
         if not rows:
             return None
-        # Common freqtrade json format: list of lists [ts_ms, o, h, l, c, v]
+        # Common freqtrade json format: list of lists [ts_ms, o, h, l, c, v].
+        # Downloads are written sorted ascending, so the bounds are just the
+        # first and last row; only fall back to a full scan if that invariant
+        # does not hold.
         if isinstance(rows[0], (list, tuple)) and len(rows[0]) >= 6:
-            # compute min/max of timestamp (ms)
-            tmin = min(int(r[0]) for r in rows)
-            tmax = max(int(r[0]) for r in rows)
+            tmin = int(rows[0][0])
+            tmax = int(rows[-1][0])
+            if tmax < tmin:
+                tmin = min(int(r[0]) for r in rows)
+                tmax = max(int(r[0]) for r in rows)
             return (
                 dt.datetime.fromtimestamp(tmin / 1000, dt.timezone.utc),
                 dt.datetime.fromtimestamp(tmax / 1000, dt.timezone.utc),
             )
         # Fallback: list of dicts with possible keys
         if isinstance(rows[0], dict):
-            # Try ms fields
             keys = ["time", "timestamp", "date", "t", "open_time"]
+            # Vectorized path: one DataFrame build + columnar min/max instead
+            # of a Python loop per row
+            if pd is not None:
+                df = pd.DataFrame(rows)
+                col = next((k for k in keys if k in df.columns), None)
+                if col is None:
+                    return None
+                s = df[col].dropna()
+                if s.empty:
+                    return None
+                if pd.api.types.is_numeric_dtype(s):
+                    e = s.to_numpy(dtype=float)
+                    e = np.where(e > 10_000_000_000, e / 1e9, np.where(e > 10_000_000, e / 1e3, e))
+                    return (
+                        dt.datetime.fromtimestamp(float(e.min()), dt.timezone.utc),
+                        dt.datetime.fromtimestamp(float(e.max()), dt.timezone.utc),
+                    )
+                parsed = pd.to_datetime(s, utc=True, errors="coerce").dropna()
+                if parsed.empty:
+                    return None
+                return (parsed.min().to_pydatetime(), parsed.max().to_pydatetime())
+            # Stdlib path (no pandas installed)
             ts = None
             te = None
             for r in rows:
@@ -93,13 +252,38 @@ def read_ts_range(path: Path) -> Optional[Tuple[dt.datetime, dt.datetime]]:
                 return (ts, te)
         return None
 
+    if path.suffix in (".feather", ".parquet"):
+        return _columnar_ts_range(path)
+
+    # Uncompressed JSON: O(1) head/tail scan beats any full parse
+    if path.suffix == ".json":
+        rng = _mmap_ts_range(path)
+        if rng:
+            return rng
+
+    # Streaming fast path for the common list-of-lists format (O(1) memory)
+    if ijson is not None:
+        try:
+            if path.suffix == ".gz":
+                with _open_gz(path) as f:
+                    rng = _stream_ts_range(f)
+            else:
+                with path.open("rb") as f:
+                    rng = _stream_ts_range(f)
+            if rng:
+                return rng
+        except Exception:
+            pass
+
     try:
+        # Full-file fallback; orjson takes bytes directly, skipping the
+        # utf-8 decode step, and is much faster on numeric rows.
         if path.suffix == ".gz":
-            with gzip.open(path, "rt", encoding="utf-8") as f:
-                rows = json.load(f)
+            with _open_gz(path) as f:
+                data = f.read()
         else:
-            with path.open("r", encoding="utf-8") as f:
-                rows = json.load(f)
+            data = path.read_bytes()
+        rows = orjson.loads(data) if orjson is not None else json.loads(data)
         return _parse_rows(rows)
     except Exception:
         return None
@@ -166,14 +350,18 @@ def main() -> int:
     print(f"Backtest: start={start.date()} end={end.date()} (need data from <= {earliest_needed.date()} to >= {need_latest.date()})")
     print("")
 
+    # Scan files in parallel: gzip inflate and file I/O release the GIL, so
+    # wall time approaches the slowest single file instead of the sum.
+    tasks = [(pair, infer_data_path(exch, timeframe, pair, mode)) for pair in pairs]
+    with ThreadPoolExecutor(max_workers=min(8, max(1, len(tasks)))) as ex:
+        ranges = list(ex.map(lambda t: read_ts_range(t[1]) if t[1] else None, tasks))
+
     ok = True
-    for pair in pairs:
-        path = infer_data_path(exch, timeframe, pair, mode)
+    for (pair, path), rng in zip(tasks, ranges):
         if not path:
             print(f"[MISSING] {pair}: no file found under user_data/data/{exch}/({mode if mode != 'spot' else ''})")
             ok = False
             continue
-        rng = read_ts_range(path)
         if not rng:
             print(f"[UNREADABLE] {pair}: could not parse timestamps from {path}")
             ok = False
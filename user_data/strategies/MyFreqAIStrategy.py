@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import logging
 
@@ -13,21 +13,205 @@ from freqtrade.strategy import (
 from freqtrade.enums import RunMode
 
 try:
-    import talib.abstract as ta
+    import numexpr as ne  # Optional: fuses boolean expressions into one SIMD pass
+except Exception:
+    ne = None  # type: ignore
+
+try:
+    import orjson  # Optional: faster JSON decode, takes bytes directly
+except Exception:
+    orjson = None  # type: ignore
+
+try:
+    import talib
 except Exception as e:  # pragma: no cover - container provides TA-Lib
-    ta = None  # type: ignore
+    talib = None  # type: ignore
 
 try:
     from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer  # type: ignore
 except Exception:
     SentimentIntensityAnalyzer = None  # type: ignore
 
+import functools
 import os
+import sys
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# Sibling fallback kernels; freqtrade loads strategy files by path, so make
+# sure the strategies dir is importable
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+try:
+    import _jit
+except Exception:
+    _jit = None  # type: ignore
 
 
 logger = logging.getLogger(__name__)
 
+# Resolve the indicator backend once at import instead of branching on every
+# populate call: talib's C entry points when present, else the numba/numpy
+# kernels (same ndarray signatures), else None -> NaN indicators.
+if talib is not None:
+    _RSI, _WILLR, _ADX = talib.RSI, talib.WILLR, talib.ADX
+elif _jit is not None:
+    def _RSI(close, timeperiod=14):
+        return _jit._rsi(close, timeperiod)
+
+    def _WILLR(high, low, close, timeperiod=14):
+        return _jit._willr(high, low, close, timeperiod)
+
+    def _ADX(high, low, close, timeperiod=14):
+        return _jit._adx(high, low, close, timeperiod)
+
+    if not _jit.NUMBA_AVAILABLE:
+        logger.warning("TA-Lib and numba unavailable: using slow pure-Python indicator fallback.")
+else:
+    _RSI = _WILLR = _ADX = None  # type: ignore
+    logger.warning("TA-Lib not available: indicators will be NaN; no trades will trigger.")
+
+# Stub sentiment texts; placeholders until real feeds are wired in
+_POS_TMPL = "{pair} bullish momentum!"
+_NEG_TMPL = "Concerns around {pair} pullback"
+
+_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Shared HTTP session with pooling + retries for external signal APIs."""
+    global _SESSION
+    if _SESSION is None:
+        s = requests.Session()
+        s.headers.update({"User-Agent": "rsi-freqai-bot/1.0"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        _SESSION = s
+    return _SESSION
+
+
+def _sma(values: np.ndarray, window: int) -> np.ndarray:
+    """Uniform-window SMA via cumulative sum: one branchless pass over the data,
+    much cheaper than pandas' generic rolling engine."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        c = np.cumsum(values, dtype=np.float64)
+        out[window - 1:] = (c[window - 1:] - np.concatenate(([0.0], c[:-window]))) / window
+    return out
+
+
+_TA_CACHE: Dict[tuple, np.ndarray] = {}
+_TA_CACHE_MAX = 256
+_TA_CACHE_LOCK = threading.Lock()
+
+
+def _cached_ta(key: tuple, compute) -> np.ndarray:
+    """Memoize indicator arrays keyed by (kind, pair, length, last candle, period).
+
+    Hyperopt and FreqAI re-populate indicators on identical OHLCV; reuse the
+    arrays when the inputs cannot have changed. Evicts oldest-inserted entries
+    past the cap (dicts preserve insertion order) instead of dropping the whole
+    cache — correctness only depends on the key, not on retention. Eviction and
+    insert happen under a lock: FreqAI's training thread reaches this cache
+    concurrently with the main thread's populate_indicators.
+    """
+    arr = _TA_CACHE.get(key)
+    if arr is None:
+        arr = np.asarray(compute())
+        with _TA_CACHE_LOCK:
+            while len(_TA_CACHE) >= _TA_CACHE_MAX:
+                _TA_CACHE.pop(next(iter(_TA_CACHE)), None)
+            _TA_CACHE[key] = arr
+    return arr
+
+
+@functools.lru_cache(maxsize=1)
+def _get_analyzer():
+    """Build the VADER analyzer once per process (the lexicon load is not free)."""
+    if SentimentIntensityAnalyzer is None:
+        return None
+    try:
+        return SentimentIntensityAnalyzer()
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _pair_sentiment(pair: str) -> Optional[float]:
+    """Average VADER compound score for the pair's stub texts.
+
+    Deterministic per pair, so tokenization/lexicon lookup runs once per pair
+    per process; failures cache as None (neutral) and are logged once.
+    """
+    analyzer = _get_analyzer()
+    if analyzer is None:
+        return None
+    try:
+        pos = analyzer.polarity_scores(_POS_TMPL.format(pair=pair))["compound"]
+        neg = analyzer.polarity_scores(_NEG_TMPL.format(pair=pair))["compound"]
+        return (pos + neg) * 0.5
+    except Exception as e:
+        logger.warning("Sentiment analysis failed, defaulting neutral: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _fg_info(path: str, bucket: int) -> Tuple[bool, float]:
+    """Existence + mtime of the Fear&Greed CSV, refreshed once per bucket
+    (one minute) instead of a stat syscall on every populate call."""
+    try:
+        st = os.stat(path)
+        return (True, st.st_mtime)
+    except OSError:
+        return (False, 0.0)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_fg(path: str, mtime: float) -> Optional[pd.Series]:
+    """Parse the historical Fear&Greed CSV once per (path, mtime).
+
+    Returns a float series in [0, 1] indexed by day (datetime64[D]), or None if
+    the file is unusable. mtime is part of the key so edits invalidate the cache.
+    """
+    try:
+        fg = pd.read_csv(path)
+        if not {"date", "value"}.issubset(set(fg.columns)):
+            return None
+        idx = pd.to_datetime(fg["date"]).values.astype("datetime64[D]")
+        return pd.Series(fg["value"].astype(float).values / 100.0, index=idx).sort_index()
+    except Exception as e:
+        logger.warning("Failed to parse historical Fear&Greed CSV: %s", e)
+        return None
+
+
+def _parse_fng(resp) -> float:
+    """Pluck the 0..1 index value out of an alternative.me /fng/ response."""
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
+    return int(data["data"][0]["value"]) / 100.0
+
+
+def _attach_fg(dataframe: pd.DataFrame, fg_series: pd.Series) -> None:
+    """Attach the fear_greed column via one vectorized day lookup.
+
+    Shared by live and backtest so both stay a single cached reindex. Floors
+    to day with a datetime64[D] cast (no Python date objects); days missing
+    from the CSV take the most recent prior reading (asof-backward), neutral
+    0.5 only before the first row.
+    """
+    days = dataframe["date"].values.astype("datetime64[D]")
+    dataframe["fear_greed"] = (
+        fg_series.reindex(days, method="ffill")
+        .fillna(0.5)
+        .to_numpy(dtype=np.float32)
+    )
+
 
 class MyFreqAIStrategy(IStrategy):
     # Core settings
@@ -63,6 +247,16 @@ class MyFreqAIStrategy(IStrategy):
         },
     }
 
+    # Last live Fear&Greed reading shared across pairs: (monotonic ts, value).
+    # The index is global, so one fetch per TTL serves every pair.
+    _FG_CACHE: Tuple[float, float] = (0.0, 0.5)
+    _FG_TTL = 600.0  # seconds; the index updates daily, 10 min is plenty fresh
+
+    # One-shot warning flags: a flaky API or disabled FreqAI would otherwise
+    # log once per pair per candle
+    _fg_fetch_warned = False
+    _freqai_warned = False
+
     # Optional hyperopt ranges (kept minimal)
     rsi_period = IntParameter(9, 21, default=14, space="buy")
     willr_period = IntParameter(10, 21, default=14, space="buy")
@@ -72,6 +266,27 @@ class MyFreqAIStrategy(IStrategy):
     def informative_pairs(self):
         return []
 
+    def bot_start(self, **kwargs) -> None:
+        """Start the background Fear&Greed refresher in live/dry-run so the
+        indicator hot path reads a warm cache instead of blocking on HTTP."""
+        if self.dp and self.dp.runmode in {RunMode.DRY_RUN, RunMode.LIVE}:
+            if not getattr(self, "_fng_thread", None):
+                t = threading.Thread(target=self._refresh_fng_loop, daemon=True, name="fng-refresh")
+                self._fng_thread = t
+                t.start()
+
+    def _refresh_fng_loop(self) -> None:
+        """Daemon loop: refresh the shared Fear&Greed cache once per TTL."""
+        cls = type(self)
+        while True:
+            try:
+                resp = get_session().get("https://api.alternative.me/fng/?limit=1", timeout=(1, 3))
+                if resp.ok:
+                    cls._FG_CACHE = (time.monotonic(), _parse_fng(resp))
+            except Exception as e:
+                logger.debug("Background Fear&Greed refresh failed: %s", e)
+            time.sleep(cls._FG_TTL)
+
     # ---------- Feature helpers ----------
     def add_sentiment_features(self, dataframe: pd.DataFrame, metadata: Dict) -> pd.DataFrame:
         """Add sentiment features using VADER when available. Fallback to neutral.
@@ -79,128 +294,278 @@ class MyFreqAIStrategy(IStrategy):
         """
         # Disable network during backtesting/hyperopt to keep runs reproducible
         if self._is_historic_run():
-            dataframe["sentiment_compound"] = 0.0
-            dataframe["sentiment_normalized"] = 0.5
+            dataframe["sentiment_compound"] = np.float32(0.0)
+            dataframe["sentiment_normalized"] = np.float32(0.5)
             return dataframe
-        try:
-            analyzer = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer else None
-        except Exception:
-            analyzer = None
-
-        score: Optional[float] = None
-        if analyzer:
-            try:
-                texts = [
-                    f"{metadata.get('pair', 'PAIR')} bullish momentum!",
-                    f"Concerns around {metadata.get('pair', 'PAIR')} pullback",
-                ]
-                scores = [analyzer.polarity_scores(t)["compound"] for t in texts]
-                score = float(pd.Series(scores).mean())
-            except Exception as e:
-                logger.warning("Sentiment analysis failed, defaulting neutral: %s", e)
-
+        score = _pair_sentiment(metadata.get("pair", "PAIR"))
         if score is None:
             score = 0.0
 
-        dataframe["sentiment_compound"] = score
-        # Normalize [-1,1] -> [0,1]
-        dataframe["sentiment_normalized"] = (dataframe["sentiment_compound"] + 1.0) / 2.0
+        # Normalize [-1,1] -> [0,1] once as a scalar; broadcasting the result
+        # avoids an O(N) arithmetic pass over a constant column.
+        dataframe["sentiment_compound"] = np.float32(score)
+        dataframe["sentiment_normalized"] = np.float32((score + 1.0) / 2.0)
         return dataframe
 
     def add_fear_greed(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         """Attach Fear & Greed Index.
         Priority: use historical CSV if present -> live API (non-historic only) -> neutral 0.5.
         """
-        # Try historical CSV merge first (reproducible backtests)
+        # Try historical CSV first (reproducible backtests); parsed once via _load_fg
         try:
             fg_path = os.path.join("/freqtrade", "user_data", "data", "fear_greed.csv")
-            if os.path.exists(fg_path):
-                fg = pd.read_csv(fg_path)
-                # Expect columns: date (YYYY-MM-DD), value (0..100)
-                if {"date", "value"}.issubset(set(fg.columns)) and "date" in dataframe.columns:
-                    fg["date"] = pd.to_datetime(fg["date"]).dt.date
-                    left = dataframe.copy()
-                    left["_date_only"] = pd.to_datetime(left["date"]).dt.date
-                    fg["fear_greed"] = fg["value"].astype(float) / 100.0
-                    merged = left.merge(
-                        fg[["date", "fear_greed"]],
-                        left_on="_date_only",
-                        right_on="date",
-                        how="left",
-                    )
-                    dataframe["fear_greed"] = merged["fear_greed"].fillna(0.5).values
+            fg_exists, fg_mtime = _fg_info(fg_path, int(time.time()) // 60)
+            if fg_exists and "date" in dataframe.columns:
+                fg_series = _load_fg(fg_path, fg_mtime)
+                if fg_series is not None:
+                    _attach_fg(dataframe, fg_series)
                     return dataframe
         except Exception as e:  # pragma: no cover
-            logger.warning("Failed to merge historical Fear&Greed: %s", e)
+            logger.warning("Failed to attach historical Fear&Greed: %s", e)
 
-        # Live fetch only when not backtesting/hyperopting
+        # Live fetch only when not backtesting/hyperopting; one HTTP GET per
+        # TTL window total, not one per pair per candle. Split connect/read
+        # timeouts keep the worst-case stall short.
         fg_value = 0.5
         if not self._is_historic_run():
-            try:
-                resp = requests.get("https://api.alternative.me/fng/?limit=1", timeout=5)
-                if resp.ok:
-                    fg_value = int(resp.json()["data"][0]["value"]) / 100.0
-            except Exception as e:
-                logger.warning("Fear&Greed fetch failed, using neutral 0.5: %s", e)
-
-        dataframe["fear_greed"] = fg_value
+            cls = type(self)
+            now = time.monotonic()
+            if cls._FG_CACHE[0] == 0.0 or now - cls._FG_CACHE[0] > cls._FG_TTL:
+                try:
+                    resp = get_session().get("https://api.alternative.me/fng/?limit=1", timeout=(1, 3))
+                    if resp.ok:
+                        cls._FG_CACHE = (now, _parse_fng(resp))
+                except Exception as e:
+                    if not cls._fg_fetch_warned:
+                        logger.warning("Fear&Greed fetch failed, using neutral 0.5: %s", e)
+                        cls._fg_fetch_warned = True
+                    else:
+                        logger.debug("Fear&Greed fetch failed again: %s", e)
+            fg_value = cls._FG_CACHE[1]
+
+        dataframe["fear_greed"] = np.float32(fg_value)
         return dataframe
 
     # ---------- Indicators & Signals ----------
+    def _params(self) -> Tuple[int, int, int, float]:
+        """Plain-scalar snapshot of the hyperopt parameters.
+
+        IntParameter.value is a property access plus an int() cast on every
+        use; cache the tuple per instance. Hyperopt mutates parameters between
+        epochs, so in that runmode the values are re-read every call.
+        """
+        p = getattr(self, "_param_cache", None)
+        if p is None or (self.dp and self.dp.runmode == RunMode.HYPEROPT):
+            p = (
+                int(self.rsi_period.value),
+                int(self.willr_period.value),
+                int(self.adx_min.value),
+                float(self.sentiment_floor.value),
+            )
+            self._param_cache = p
+        return p
+
+    def _ensure_base_indicators(self, dataframe: pd.DataFrame, pair: str) -> None:
+        """Compute RSI/WILLR/ADX columns, reusing cached arrays where possible."""
+        last_ts = dataframe["date"].iat[-1] if "date" in dataframe.columns and len(dataframe) else None
+        n = len(dataframe)
+        rsi_n, willr_n, _, _ = self._params()
+        # Low-level talib entry points take/return plain ndarrays, skipping the
+        # abstract API's column introspection and Series wrapping per call.
+        # float32 is plenty for 0-100 scale indicators and halves the bytes
+        # moved through every downstream mask / FreqAI feature copy.
+        dataframe["rsi"] = _cached_ta(
+            ("rsi", pair, n, last_ts, rsi_n),
+            lambda: _RSI(
+                dataframe["close"].to_numpy(dtype=np.float64), timeperiod=rsi_n
+            ).astype(np.float32, copy=False),
+        )
+        dataframe["willr"] = _cached_ta(
+            ("willr", pair, n, last_ts, willr_n),
+            lambda: _WILLR(
+                dataframe["high"].to_numpy(dtype=np.float64),
+                dataframe["low"].to_numpy(dtype=np.float64),
+                dataframe["close"].to_numpy(dtype=np.float64),
+                timeperiod=willr_n,
+            ).astype(np.float32, copy=False),
+        )
+        dataframe["adx"] = _cached_ta(
+            ("adx", pair, n, last_ts, 14),
+            lambda: _ADX(
+                dataframe["high"].to_numpy(dtype=np.float64),
+                dataframe["low"].to_numpy(dtype=np.float64),
+                dataframe["close"].to_numpy(dtype=np.float64),
+                timeperiod=14,
+            ).astype(np.float32, copy=False),
+        )
+
+    def _tail_update_indicators(self, dataframe: pd.DataFrame, pair: str) -> bool:
+        """Live/dry-run fast path: recompute indicators only on the changed tail.
+
+        With process_only_new_candles the frame grows (or slides) by a few rows
+        per tick, yet TA ran over the full history every time. Reuse the arrays
+        cached from the previous call for the unchanged head and run TA on a
+        startup_candle_count-sized tail only — the same warmup the strategy
+        already assumes sufficient. Returns False when the fast path does not
+        apply (first call, reshaped frame, backtest, ...).
+        """
+        if not (self.dp and self.dp.runmode in {RunMode.DRY_RUN, RunMode.LIVE}):
+            return False
+        cache = getattr(self, "_ind_tail_cache", None)
+        if cache is None:
+            self._ind_tail_cache = cache = {}
+        prev = cache.get(pair)
+        if not prev or "date" not in dataframe.columns or not len(dataframe):
+            return False
+
+        dates = dataframe["date"].values
+        # to_datetime64() drops the tz without the deprecated tz-aware
+        # np.datetime64 parse (the date column is UTC throughout)
+        prev_last = prev["last_ts"].to_datetime64()
+        pos = int(np.searchsorted(dates, prev_last))
+        if pos >= len(dates) or dates[pos] != prev_last:
+            return False
+        prev_n = prev["n"]
+        if prev_n - 1 - pos < 0:
+            return False
+        k = len(dates) - 1 - pos  # candles appended since the previous call
+
+        tail_vals = {}
+        if k:
+            warm = min(len(dataframe), int(self.startup_candle_count) + k)
+            tail_df = dataframe.iloc[-warm:]
+            t_high = tail_df["high"].to_numpy(dtype=np.float64)
+            t_low = tail_df["low"].to_numpy(dtype=np.float64)
+            t_close = tail_df["close"].to_numpy(dtype=np.float64)
+            rsi_n, willr_n, _, _ = self._params()
+            tail_vals = {
+                "rsi": _RSI(t_close, timeperiod=rsi_n),
+                "willr": _WILLR(t_high, t_low, t_close, timeperiod=willr_n),
+                "adx": _ADX(t_high, t_low, t_close, timeperiod=14),
+            }
+        for col in ("rsi", "willr", "adx"):
+            full = np.empty(len(dataframe), dtype=np.float32)
+            full[: pos + 1] = prev["cols"][col][prev_n - 1 - pos:]
+            if k:
+                full[pos + 1:] = tail_vals[col][-k:]
+            dataframe[col] = full
+        return True
+
+    def _remember_indicators(self, dataframe: pd.DataFrame, pair: str) -> None:
+        """Cache indicator arrays for the tail-update fast path (live/dry-run)."""
+        if not (self.dp and self.dp.runmode in {RunMode.DRY_RUN, RunMode.LIVE}):
+            return
+        if "date" not in dataframe.columns or not len(dataframe):
+            return
+        cache = getattr(self, "_ind_tail_cache", None)
+        if cache is None:
+            self._ind_tail_cache = cache = {}
+        cache[pair] = {
+            "last_ts": dataframe["date"].iat[-1],
+            "n": len(dataframe),
+            "cols": {c: dataframe[c].to_numpy() for c in ("rsi", "willr", "adx")},
+        }
+
     def populate_indicators(self, dataframe: pd.DataFrame, metadata: Dict) -> pd.DataFrame:
-        # RSI and WILLR
-        if ta is None:
-            # Basic numpy fallbacks if TA-Lib not present (very rough)
+        # RSI, WILLR, ADX through the backend resolved at import time; the
+        # jit kernels share the caching and tail-update paths with talib
+        if _RSI is None:
             dataframe["rsi"] = pd.Series(np.nan, index=dataframe.index)
             dataframe["willr"] = pd.Series(np.nan, index=dataframe.index)
             dataframe["adx"] = pd.Series(np.nan, index=dataframe.index)
-            logger.warning("TA-Lib not available: indicators set to NaN; no trades will trigger.")
         else:
-            dataframe["rsi"] = ta.RSI(dataframe, timeperiod=int(self.rsi_period.value))
-            dataframe["willr"] = ta.WILLR(dataframe, timeperiod=int(self.willr_period.value))
-            dataframe["adx"] = ta.ADX(dataframe)
-
-        # Add sentiment & fear/greed
-        dataframe = self.add_sentiment_features(dataframe, metadata)
+            pair = metadata.get("pair", "")
+            if not self._tail_update_indicators(dataframe, pair):
+                self._ensure_base_indicators(dataframe, pair)
+            self._remember_indicators(dataframe, pair)
+
+        # Add sentiment & fear/greed. In plain backtest the sentiment stub is
+        # a constant 0.5, so skip the columns unless the entry floor actually
+        # consumes them. Hyperopt must keep them: populate_indicators runs
+        # once before the optimizer assigns epoch parameters, so skipping on
+        # the default floor would silently disable the sentiment_floor space.
+        # Fear/greed stays in all modes (the CSV history is a FreqAI feature).
+        _, _, _, sent_floor = self._params()
+        hyperopt = bool(self.dp and self.dp.runmode == RunMode.HYPEROPT)
+        if hyperopt or not self._is_historic_run() or sent_floor > 0.0:
+            dataframe = self.add_sentiment_features(dataframe, metadata)
         dataframe = self.add_fear_greed(dataframe)
 
-        # Volume rolling mean (basic filter)
+        # Volume rolling mean (basic filter); compute the above-average flag
+        # once here so entry and FreqAI features both reuse it
         if "volume" in dataframe.columns:
-            dataframe["vol_sma50"] = dataframe["volume"].rolling(50).mean()
+            vol = dataframe["volume"].to_numpy(dtype=np.float64)
+            sma = _sma(vol, 50)
+            dataframe["vol_sma50"] = sma.astype(np.float32, copy=False)
+            dataframe["vol_above_sma50"] = (vol > np.nan_to_num(sma)).astype(np.float32)
 
         # Attempt FreqAI pipeline (safe no-op if disabled or unavailable)
         try:
             if getattr(self, "freqai", None):
                 dataframe = self.freqai.start(dataframe, metadata, self)
         except Exception as e:  # pragma: no cover
-            logger.warning("FreqAI integration skipped due to error: %s", e)
+            if not type(self)._freqai_warned:
+                logger.warning("FreqAI integration skipped due to error: %s", e)
+                type(self)._freqai_warned = True
+            else:
+                logger.debug("FreqAI integration skipped again: %s", e)
+
+        # Stash array views for populate_entry/exit_trend, which freqtrade
+        # calls back-to-back on this same frame — they can then skip the
+        # pandas column-get path entirely
+        dataframe.attrs["_np"] = {
+            c: dataframe[c].to_numpy() for c in ("rsi", "willr", "adx") if c in dataframe.columns
+        }
 
         return dataframe
 
-    def populate_entry_trend(self, dataframe: pd.DataFrame, metadata: Dict) -> pd.DataFrame:
-        dataframe.loc[:, "enter_long"] = 0
+    @staticmethod
+    def _np_col(dataframe: pd.DataFrame, name: str) -> np.ndarray:
+        """Indicator column as ndarray, preferring the views stashed in attrs."""
+        arr = dataframe.attrs.get("_np", {}).get(name)
+        if arr is not None and len(arr) == len(dataframe):
+            return arr
+        return dataframe[name].to_numpy()
 
-        cond = (
-            (dataframe["rsi"] < 30)
-            & (dataframe["willr"] < -80)
-            & (dataframe["adx"] > int(self.adx_min.value))
-        )
+    def populate_entry_trend(self, dataframe: pd.DataFrame, metadata: Dict) -> pd.DataFrame:
+        # Work on numpy arrays: no per-op Series allocation / index alignment
+        _, _, adx_min, sent_floor = self._params()
+        rsi = self._np_col(dataframe, "rsi")
+        willr = self._np_col(dataframe, "willr")
+        adx = self._np_col(dataframe, "adx")
+        if ne is not None:
+            cond = ne.evaluate(
+                "(rsi < 30) & (willr < -80) & (adx > adx_min)",
+                local_dict={"rsi": rsi, "willr": willr, "adx": adx, "adx_min": adx_min},
+            )
+        else:
+            # Explicit out= buffers: two boolean allocations total instead of
+            # one per comparison/combiner
+            cond = np.less(rsi, 30)
+            tmp = np.less(willr, -80)
+            np.logical_and(cond, tmp, out=cond)
+            np.greater(adx, adx_min, out=tmp)
+            np.logical_and(cond, tmp, out=cond)
 
         # Optional volume filter when available
-        if "vol_sma50" in dataframe.columns:
-            cond &= dataframe["volume"] > dataframe["vol_sma50"].fillna(0)
+        if "vol_above_sma50" in dataframe.columns:
+            cond &= dataframe["vol_above_sma50"].to_numpy() > 0
+        elif "vol_sma50" in dataframe.columns:
+            cond &= dataframe["volume"].to_numpy() > np.nan_to_num(dataframe["vol_sma50"].to_numpy())
 
         # Optional sentiment floor if provided via hyperopt/config (default 0.0 = disabled)
-        if "sentiment_normalized" in dataframe.columns and float(self.sentiment_floor.value) > 0.0:
-            cond &= dataframe["sentiment_normalized"] >= float(self.sentiment_floor.value)
+        if "sentiment_normalized" in dataframe.columns and sent_floor > 0.0:
+            cond &= dataframe["sentiment_normalized"].to_numpy() >= sent_floor
 
         # Optional FreqAI gating if predictions exist
         if "do_predict" in dataframe.columns:
-            cond &= dataframe["do_predict"] == 1
+            cond &= dataframe["do_predict"].to_numpy() == 1
         if "DI_values" in dataframe.columns:
-            cond &= dataframe["DI_values"].fillna(1.0) < 0.05
+            cond &= np.nan_to_num(dataframe["DI_values"].to_numpy(), nan=1.0) < 0.05
 
-        dataframe.loc[cond, ["enter_long"]] = 1
+        # int8 signal column: freqtrade only checks truthiness; view() reuses
+        # the mask's buffer instead of copying it
+        dataframe["enter_long"] = cond.view(np.int8)
 
         return dataframe
 
@@ -217,25 +582,25 @@ class MyFreqAIStrategy(IStrategy):
 
     def feature_engineering_standard(self, dataframe: pd.DataFrame, **kwargs) -> pd.DataFrame:
         """Provide core features for FreqAI. Columns must be prefixed with '%-'."""
-        # Ensure base indicators exist
-        if "rsi" not in dataframe.columns and ta is not None:
-            dataframe["rsi"] = ta.RSI(dataframe, timeperiod=int(self.rsi_period.value))
-        if "willr" not in dataframe.columns and ta is not None:
-            dataframe["willr"] = ta.WILLR(dataframe, timeperiod=int(self.willr_period.value))
-        if "adx" not in dataframe.columns and ta is not None:
-            dataframe["adx"] = ta.ADX(dataframe)
-
-        dataframe["%-rsi"] = dataframe.get("rsi")
-        dataframe["%-willr"] = dataframe.get("willr")
-        dataframe["%-adx"] = dataframe.get("adx")
+        # Ensure base indicators exist; _cached_ta makes this a lookup when
+        # populate_indicators already computed them for the same candles
+        if _RSI is not None and not {"rsi", "willr", "adx"}.issubset(dataframe.columns):
+            md = kwargs.get("metadata")
+            pair = md.get("pair", "") if isinstance(md, dict) else ""
+            self._ensure_base_indicators(dataframe, pair)
+
+        for src, dst in (("rsi", "%-rsi"), ("willr", "%-willr"), ("adx", "%-adx")):
+            if src in dataframe.columns:
+                dataframe[dst] = dataframe[src].astype(np.float32, copy=False)
         if "fear_greed" in dataframe.columns:
-            dataframe["%-fear_greed"] = dataframe["fear_greed"].fillna(0.5)
+            dataframe["%-fear_greed"] = dataframe["fear_greed"].fillna(0.5).astype(np.float32, copy=False)
         if "sentiment_normalized" in dataframe.columns:
-            dataframe["%-sentiment"] = dataframe["sentiment_normalized"].fillna(0.5)
+            dataframe["%-sentiment"] = dataframe["sentiment_normalized"].fillna(0.5).astype(np.float32, copy=False)
         if "volume" in dataframe.columns:
-            if "vol_sma50" not in dataframe.columns:
-                dataframe["vol_sma50"] = dataframe["volume"].rolling(50).mean()
-            dataframe["%-vol_above_sma50"] = (dataframe["volume"] > dataframe["vol_sma50"].fillna(0)).astype(float)
+            if "vol_above_sma50" not in dataframe.columns:
+                vol = dataframe["volume"].to_numpy(dtype=np.float64)
+                dataframe["vol_above_sma50"] = (vol > np.nan_to_num(_sma(vol, 50))).astype(np.float32)
+            dataframe["%-vol_above_sma50"] = dataframe["vol_above_sma50"].astype(np.float32, copy=False)
         return dataframe
 
     # ---------- Helpers ----------
@@ -247,15 +612,14 @@ class MyFreqAIStrategy(IStrategy):
             return False
 
     def populate_exit_trend(self, dataframe: pd.DataFrame, metadata: Dict) -> pd.DataFrame:
-        dataframe.loc[:, "exit_long"] = 0
-
         # Simple exit: Overbought or profit target met by ROI table
-        dataframe.loc[
-            (
-                (dataframe["rsi"] > 70)
-                | (dataframe["willr"] > -20)
-            ),
-            ["exit_long"],
-        ] = 1
+        rsi = self._np_col(dataframe, "rsi")
+        willr = self._np_col(dataframe, "willr")
+        if ne is not None:
+            mask = ne.evaluate("(rsi > 70) | (willr > -20)", local_dict={"rsi": rsi, "willr": willr})
+        else:
+            mask = np.greater(rsi, 70)
+            np.logical_or(mask, np.greater(willr, -20), out=mask)
+        dataframe["exit_long"] = mask.view(np.int8)
 
         return dataframe
@@ -0,0 +1,145 @@
+"""Numba-accelerated indicator fallbacks for when TA-Lib is unavailable.
+
+Pure-numpy/loop implementations of the strategy's three base indicators using
+the standard Wilder recursions. With numba installed the kernels are
+JIT-compiled (cached to disk); without it they still run as plain Python so
+the strategy keeps working, just slower.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator shim so the kernels stay importable without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(fn):
+            return fn
+
+        return wrap
+
+
+@njit(cache=True)
+def _rsi(close, n):
+    m = close.shape[0]
+    out = np.full(m, np.nan, dtype=np.float32)
+    if m <= n:
+        return out
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, n + 1):
+        d = close[i] - close[i - 1]
+        if d > 0.0:
+            gain += d
+        else:
+            loss -= d
+    avg_gain = gain / n
+    avg_loss = loss / n
+    if avg_loss == 0.0:
+        out[n] = 100.0
+    else:
+        out[n] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    for i in range(n + 1, m):
+        d = close[i] - close[i - 1]
+        g = d if d > 0.0 else 0.0
+        l = -d if d < 0.0 else 0.0
+        avg_gain = (avg_gain * (n - 1) + g) / n
+        avg_loss = (avg_loss * (n - 1) + l) / n
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def _willr(high, low, close, n):
+    m = close.shape[0]
+    out = np.full(m, np.nan, dtype=np.float32)
+    for i in range(n - 1, m):
+        hh = high[i]
+        ll = low[i]
+        for j in range(i - n + 1, i):
+            if high[j] > hh:
+                hh = high[j]
+            if low[j] < ll:
+                ll = low[j]
+        rng = hh - ll
+        if rng > 0.0:
+            out[i] = -100.0 * (hh - close[i]) / rng
+        else:
+            out[i] = 0.0
+    return out
+
+
+@njit(cache=True)
+def _adx(high, low, close, n):
+    m = close.shape[0]
+    out = np.full(m, np.nan, dtype=np.float32)
+    if m <= 2 * n:
+        return out
+    # Wilder-smoothed TR / +DM / -DM over the first n bars
+    tr_s = 0.0
+    pdm_s = 0.0
+    ndm_s = 0.0
+    for i in range(1, n + 1):
+        up = high[i] - high[i - 1]
+        dn = low[i - 1] - low[i]
+        pdm_s += up if (up > dn and up > 0.0) else 0.0
+        ndm_s += dn if (dn > up and dn > 0.0) else 0.0
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        tr_s += tr
+    dx_sum = 0.0
+    adx = 0.0
+    for i in range(n + 1, m):
+        up = high[i] - high[i - 1]
+        dn = low[i - 1] - low[i]
+        pdm = up if (up > dn and up > 0.0) else 0.0
+        ndm = dn if (dn > up and dn > 0.0) else 0.0
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+        tr_s = tr_s - tr_s / n + tr
+        pdm_s = pdm_s - pdm_s / n + pdm
+        ndm_s = ndm_s - ndm_s / n + ndm
+        if tr_s == 0.0:
+            dx = 0.0
+        else:
+            pdi = 100.0 * pdm_s / tr_s
+            ndi = 100.0 * ndm_s / tr_s
+            dx = 0.0 if pdi + ndi == 0.0 else 100.0 * abs(pdi - ndi) / (pdi + ndi)
+        if i < 2 * n:
+            dx_sum += dx
+        elif i == 2 * n:
+            dx_sum += dx
+            adx = dx_sum / n
+            out[i] = adx
+        else:
+            adx = (adx * (n - 1) + dx) / n
+            out[i] = adx
+    return out
+
+
+def rsi_willr_adx(high, low, close, rsi_n, willr_n, adx_n):
+    """Compute the three base indicators in one call; arrays come back float32."""
+    return (
+        _rsi(close, rsi_n),
+        _willr(high, low, close, willr_n),
+        _adx(high, low, close, adx_n),
+    )